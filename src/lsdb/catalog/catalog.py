@@ -351,6 +351,7 @@ class Catalog(Dataset):
         catalog_name: Union[str, None] = None,
         overwrite: bool = False,
         storage_options: Union[Dict[Any, Any], None] = None,
+        dtype_overrides: Union[Dict[str, Any], None] = None,
         **kwargs,
     ):
         """Saves the catalog to disk in HiPSCat format
@@ -358,10 +359,15 @@ class Catalog(Dataset):
         Args:
             base_catalog_path (str): Location where catalog is saved to
             catalog_name (str): The name of the catalog to be saved
+            overwrite (bool): If True existing catalog is overwritten
             storage_options (dict): Dictionary that contains abstract filesystem credentials
+            dtype_overrides (dict): Mapping of column names to the data types they are cast to
+                before being written. Columns are written unchanged by default.
             **kwargs: Arguments to pass to the parquet write operations
         """
-        io.to_hipscat(self, base_catalog_path, catalog_name, overwrite, storage_options, **kwargs)
+        io.to_hipscat(
+            self, base_catalog_path, catalog_name, overwrite, storage_options, dtype_overrides, **kwargs
+        )
 
     def join(
         self,
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import math
 from copy import copy
 from importlib.metadata import version
-from typing import TYPE_CHECKING, Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
 
 import dask
 import hipscat as hc
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from hipscat.io import FilePointer
+from hipscat.io.file_io.file_pointer import get_file_protocol, get_fs
 from hipscat.pixel_math import HealpixPixel
+from hipscat.pixel_math.healpix_pixel_function import get_pixel_argsort
 
 from lsdb.types import HealpixInfo
 
 if TYPE_CHECKING:
     from lsdb.catalog.catalog import Catalog
 
+# Minimum default number of rows in a parquet row group. Larger partitions are split
+# in at most ROW_GROUPS_PER_FILE row groups, to keep the number of row groups in
+# `_metadata` proportional to the number of partitions
+ROW_GROUP_SIZE = 65_536
+ROW_GROUPS_PER_FILE = 4
+
+# Default codec and level of the partition files. zstd compresses float-heavy catalog data
+# better than snappy, at a similar encoding speed. Level 3 is zstd's own default level
+COMPRESSION = "zstd"
+COMPRESSION_LEVEL = 3
 
 @dask.delayed
 def perform_write(
@@ -24,26 +40,107 @@ def perform_write(
         base_catalog_dir: FilePointer,
         storage_options: dict | None = None,
         **kwargs
-) -> int:
+) -> Tuple[int, pq.FileMetaData | None]:
     """Performs a write of a pandas dataframe to a single parquet file, following the hipscat structure.
 
-    To be used as a dask delayed method as part of a dask task graph.
+    To be used as a dask delayed method as part of a dask task graph. The partition is
+    streamed to the parquet writer one row group at a time, so only a single row group is
+    ever held in Arrow form next to the partition. For remote file systems the full encoded
+    file is held in memory and uploaded with a single put, rather than paying a round trip
+    for every buffered block of a streamed upload. Empty partitions are not written at all,
+    and no directory is created for them.
 
     Args:
         df (pd.DataFrame): dataframe to write to file
         hp_pixel (HealpixPixel): HEALPix pixel of file to be written
         base_catalog_dir (FilePointer): Location of the base catalog directory to write to
         storage_options (dict): fsspec storage options
-        **kwargs: other kwargs to pass to pd.to_parquet method
+        **kwargs: other kwargs to pass to the parquet write, e.g. `compression`,
+            `compression_level` or `row_group_size`
 
     Returns:
-        number of rows written to disk
+        A tuple with the number of rows written to disk and the parquet metadata
+        of the written file, which is None if the partition is empty and no file was written.
     """
+    if len(df) == 0:
+        return 0, None
     pixel_dir = hc.io.pixel_directory(base_catalog_dir, hp_pixel.order, hp_pixel.pixel)
     hc.io.file_io.make_directory(pixel_dir, exist_ok=True, storage_options=storage_options)
     pixel_path = hc.io.paths.pixel_catalog_file(base_catalog_dir, hp_pixel.order, hp_pixel.pixel)
-    hc.io.file_io.write_dataframe_to_parquet(df, pixel_path, storage_options, **kwargs)
-    return len(df)
+    metadata_collector: list = []
+    protocol = get_file_protocol(pixel_path)
+    file_system, pixel_path = get_fs(pixel_path, storage_options=storage_options)
+    if protocol == "file":
+        _write_dataframe(df, pixel_path, metadata_collector, filesystem=file_system, **kwargs)
+    else:
+        buffer = pa.BufferOutputStream()
+        _write_dataframe(df, buffer, metadata_collector, **kwargs)
+        # The Arrow buffer is uploaded as is, without copying it into a bytes object
+        file_system.pipe_file(pixel_path, memoryview(buffer.getvalue()))
+    return len(df), metadata_collector[0]
+
+
+def _write_dataframe(
+    df: pd.DataFrame,
+    where: Any,
+    metadata_collector: list,
+    row_group_size: int | None = None,
+    compression: str = COMPRESSION,
+    compression_level: int | None = None,
+    **kwargs,
+):
+    """Writes a pandas dataframe to parquet, in row groups of at most `row_group_size` rows.
+
+    Each row group is converted from its own slice of the dataframe and written before the
+    next one is converted, so peak memory holds the dataframe plus one row group of Arrow
+    data, rather than a full Arrow copy of the dataframe.
+
+    Args:
+        df (pd.DataFrame): the dataframe to write
+        where: path or writable stream to write the parquet file to
+        metadata_collector (list): list the metadata of the written file is appended to
+        row_group_size (int): maximum number of rows in each row group. Defaults to
+            splitting the dataframe in `ROW_GROUPS_PER_FILE` row groups, of at least
+            `ROW_GROUP_SIZE` rows each.
+        compression (str): the compression codec of the file
+        compression_level (int): the compression level of the codec. Defaults to
+            `COMPRESSION_LEVEL` for the default codec, and to the codec's own default
+            level otherwise.
+        **kwargs: other kwargs to pass to the pyarrow.parquet.ParquetWriter
+
+    Raises:
+        ValueError: if a compression level is given for a codec that does not take one.
+    """
+    if row_group_size is None:
+        row_group_size = max(ROW_GROUP_SIZE, math.ceil(len(df) / ROW_GROUPS_PER_FILE))
+    codec = compression.lower() if isinstance(compression, str) else compression
+    if compression_level is None and codec == COMPRESSION:
+        compression_level = COMPRESSION_LEVEL
+    elif compression_level is not None and not _supports_compression_level(codec):
+        # pyarrow only rejects the level when the writer is closed, with a misleading error
+        raise ValueError(f"Compression codec {compression!r} does not take a compression level")
+    schema = pa.Schema.from_pandas(df)
+    with pq.ParquetWriter(
+        where,
+        schema,
+        compression=compression,
+        compression_level=compression_level,
+        metadata_collector=metadata_collector,
+        **kwargs,
+    ) as writer:
+        for start in range(0, len(df), row_group_size):
+            batch = pa.RecordBatch.from_pandas(df.iloc[start : start + row_group_size], schema=schema)
+            writer.write_batch(batch, row_group_size=row_group_size)
+
+
+def _supports_compression_level(codec: str | dict | None) -> bool:
+    """Checks whether a parquet compression codec takes a compression level. Per-column
+    codecs are left for pyarrow to check."""
+    if codec is None or codec == "none":
+        return False
+    if isinstance(codec, str):
+        return pa.Codec.supports_compression_level(codec)
+    return True
 
 
 # pylint: disable=W0212
@@ -53,6 +150,7 @@ def to_hipscat(
     catalog_name: Union[str, None] = None,
     overwrite: bool = False,
     storage_options: Union[Dict[Any, Any], None] = None,
+    dtype_overrides: Union[Dict[str, Any], None] = None,
     **kwargs,
 ):
     """Writes a catalog to disk, in HiPSCat format. The output catalog comprises
@@ -65,15 +163,35 @@ def to_hipscat(
         catalog_name (str): The name of the output catalog
         overwrite (bool): If True existing catalog is overwritten
         storage_options (dict): Dictionary that contains abstract filesystem credentials
-        **kwargs: Arguments to pass to the parquet write operations
+        dtype_overrides (dict): Mapping of column names to the data types they are cast to
+            before being written, to shrink columns that do not need their full precision.
+            Columns are written unchanged by default.
+        **kwargs: Arguments to pass to the parquet write operations. Unless `compression`,
+            `compression_level` or `row_group_size` are specified, partition files are
+            compressed with `COMPRESSION` at `COMPRESSION_LEVEL`, and split in at most
+            `ROW_GROUPS_PER_FILE` row groups of at least `ROW_GROUP_SIZE` rows each.
+
+    Raises:
+        ValueError: if all the partitions of the catalog are empty, or if a compression
+            level is given for a codec that does not take one. The base directory is
+            removed again in that case, unless it already existed.
     """
     # Create base directory
     base_catalog_dir_fp = hc.io.get_file_pointer_from_path(base_catalog_path)
+    base_dir_existed = hc.io.file_io.does_file_or_directory_exist(base_catalog_dir_fp, storage_options)
     hc.io.file_io.make_directory(base_catalog_dir_fp, overwrite, storage_options)
     # Save partition parquet files
-    pixel_to_partition_size_map = write_partitions(catalog, base_catalog_dir_fp, storage_options, **kwargs)
+    try:
+        pixel_to_partition_size_map, pixel_to_file_metadata_map = write_partitions(
+            catalog, base_catalog_dir_fp, storage_options, dtype_overrides, **kwargs
+        )
+    except ValueError:
+        # Nothing was written, so don't leave behind a directory that a retry would trip over
+        if not base_dir_existed:
+            hc.io.file_io.remove_directory(base_catalog_dir_fp, True, storage_options)
+        raise
     # Save parquet metadata
-    hc.io.write_parquet_metadata(base_catalog_path, storage_options, **kwargs)
+    write_parquet_metadata(base_catalog_dir_fp, pixel_to_file_metadata_map, storage_options)
     # Save partition info
     partition_info = _get_partition_info_dict(pixel_to_partition_size_map)
     hc.io.write_partition_info(base_catalog_dir_fp, partition_info, storage_options)
@@ -102,36 +220,91 @@ def write_partitions(
     catalog: Catalog,
     base_catalog_dir_fp: FilePointer,
     storage_options: Union[Dict[Any, Any], None] = None,
+    dtype_overrides: Union[Dict[str, Any], None] = None,
     **kwargs
-) -> Dict[HealpixPixel, int]:
+) -> Tuple[Dict[HealpixPixel, int], Dict[HealpixPixel, pq.FileMetaData]]:
     """Saves catalog partitions as parquet to disk
 
+    Partitions without any rows are skipped: no file is written for their pixels, and
+    the pixels are left out of the returned dictionaries, so that they are consistently
+    absent from `_metadata` and the partition info of the saved catalog.
+
     Args:
         catalog (Catalog): A catalog to export
         base_catalog_dir_fp (FilePointer): Path to the base directory of the catalog
         storage_options (dict): Dictionary that contains abstract filesystem credentials
+        dtype_overrides (dict): Mapping of column names to the data types they are cast to
         **kwargs: Arguments to pass to the parquet write operations
 
     Returns:
-        A dictionary mapping each HEALPix pixel to the number of data points in it.
-    """
-    results = []
-    pixel_to_result_index = {}
+        A tuple of two dictionaries, the first mapping each HEALPix pixel to the number
+        of data points in it, and the second mapping each pixel to the parquet metadata
+        of its file, as collected while writing it.
 
-    partitions = catalog._ddf.to_delayed()
-    for index, (pixel, partition_index) in enumerate(catalog._ddf_pixel_map.items()):
-        results.append(
-            perform_write(partitions[partition_index], pixel, base_catalog_dir_fp, storage_options, **kwargs)
+    Raises:
+        ValueError: if all the partitions of the catalog are empty.
+    """
+    pixels = list(catalog._ddf_pixel_map.keys())
+    ddf = catalog._ddf.astype(dtype_overrides) if dtype_overrides else catalog._ddf
+    partitions = ddf.to_delayed()
+    results = [
+        perform_write(
+            partitions[catalog._ddf_pixel_map[pixel]],
+            pixel,
+            base_catalog_dir_fp,
+            storage_options,
+            **kwargs,
         )
-        pixel_to_result_index[pixel] = index
+        for pixel in pixels
+    ]
 
-    partition_sizes = dask.compute(*results)
+    pixel_to_partition_size_map = {}
+    pixel_to_file_metadata_map = {}
+    for pixel, (partition_size, file_metadata) in zip(pixels, dask.compute(*results)):
+        if partition_size > 0:
+            pixel_to_partition_size_map[pixel] = partition_size
+            pixel_to_file_metadata_map[pixel] = file_metadata
 
-    pixel_to_partition_size_map = {
-        pixel: partition_sizes[index] for pixel, index in pixel_to_result_index.items()
-    }
+    if len(pixel_to_partition_size_map) == 0:
+        raise ValueError("Cannot save an empty catalog: all of its partitions have zero rows")
+
+    return pixel_to_partition_size_map, pixel_to_file_metadata_map
 
-    return pixel_to_partition_size_map
+
+def write_parquet_metadata(
+    base_catalog_dir_fp: FilePointer,
+    pixel_to_file_metadata_map: Dict[HealpixPixel, pq.FileMetaData],
+    storage_options: Union[Dict[Any, Any], None] = None,
+):
+    """Writes the `_metadata` and `_common_metadata` files of the catalog
+
+    The file footers collected while writing the partitions are combined in memory,
+    so the partition files don't need to be listed and read back from storage.
+
+    Args:
+        base_catalog_dir_fp (FilePointer): Path to the base directory of the catalog
+        pixel_to_file_metadata_map (Dict[HealpixPixel, pq.FileMetaData]): Dictionary mapping
+            each HEALPix pixel to the parquet metadata of its partition file
+        storage_options (dict): Dictionary that contains abstract filesystem credentials
+    """
+    pixels = list(pixel_to_file_metadata_map.keys())
+    metadata_collector = []
+    for index in get_pixel_argsort(pixels):
+        pixel = pixels[index]
+        file_metadata = pixel_to_file_metadata_map[pixel]
+        file_metadata.set_file_path(hc.io.paths.pixel_catalog_file("", pixel.order, pixel.pixel))
+        metadata_collector.append(file_metadata)
+    schema = metadata_collector[0].schema.to_arrow_schema()
+    hc.io.file_io.write_parquet_metadata(
+        schema,
+        hc.io.paths.get_parquet_metadata_pointer(base_catalog_dir_fp),
+        metadata_collector=metadata_collector,
+        write_statistics=True,
+        storage_options=storage_options,
+    )
+    hc.io.file_io.write_parquet_metadata(
+        schema, hc.io.paths.get_common_metadata_pointer(base_catalog_dir_fp), storage_options=storage_options
+    )
 
 
 def _get_partition_info_dict(ddf_points_map: Dict[HealpixPixel, int]) -> Dict[HealpixPixel, HealpixInfo]:
@@ -174,6 +347,13 @@ def create_modified_catalog_structure(
     return new_hc_structure
 
 
+@functools.lru_cache(maxsize=None)
+def _get_lsdb_version() -> str:
+    """Gets the installed lsdb version. Looking up package metadata scans sys.path, so it is
+    done once, on the first save, rather than on every write or at import time."""
+    return version("lsdb")
+
+
 def _get_provenance_info(catalog_structure: hc.catalog.Catalog) -> dict:
     """Fill all known information in a dictionary for provenance tracking.
 
@@ -193,7 +373,7 @@ def _get_provenance_info(catalog_structure: hc.catalog.Catalog) -> dict:
     }
     provenance_info = {
         "tool_name": "lsdb",
-        "version": version("lsdb"),
+        "version": _get_lsdb_version(),
         "runtime_args": args,
     }
     return provenance_info
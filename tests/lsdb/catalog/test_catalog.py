@@ -3,6 +3,7 @@ import os
 import dask.array as da
 import dask.dataframe as dd
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from hipscat.pixel_math import HealpixPixel
 
@@ -123,6 +124,82 @@ def test_save_catalog(small_sky_catalog, tmp_path):
     pd.testing.assert_frame_equal(expected_catalog.compute(), small_sky_catalog._ddf.compute())
 
 
+def test_save_catalog_parquet_metadata(small_sky_order1_catalog, tmp_path):
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1")
+    small_sky_order1_catalog.to_hipscat(base_catalog_path)
+    metadata = pq.read_metadata(os.path.join(base_catalog_path, "_metadata"))
+    pixels = small_sky_order1_catalog.get_healpix_pixels()
+    assert metadata.num_row_groups == len(pixels)
+    for index, pixel in enumerate(pixels):
+        row_group = metadata.row_group(index)
+        pixel_file = f"Norder={pixel.order}/Dir=0/Npix={pixel.pixel}.parquet"
+        assert row_group.column(0).file_path.endswith(pixel_file)
+        assert row_group.num_rows == len(small_sky_order1_catalog.get_partition(pixel.order, pixel.pixel))
+
+
+def test_save_catalog_parquet_write_options(small_sky_order1_catalog, tmp_path):
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1")
+    small_sky_order1_catalog.to_hipscat(base_catalog_path, row_group_size=10)
+    pixel_metadata = pq.read_metadata(os.path.join(base_catalog_path, "Norder=1/Dir=0/Npix=44.parquet"))
+    assert pixel_metadata.num_row_groups == 5
+    assert pixel_metadata.row_group(0).column(0).compression == "ZSTD"
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1_snappy")
+    small_sky_order1_catalog.to_hipscat(base_catalog_path, compression="snappy")
+    pixel_metadata = pq.read_metadata(os.path.join(base_catalog_path, "Norder=1/Dir=0/Npix=44.parquet"))
+    assert pixel_metadata.row_group(0).column(0).compression == "SNAPPY"
+    expected_catalog = lsdb.read_hipscat(base_catalog_path)
+    pd.testing.assert_frame_equal(expected_catalog.compute(), small_sky_order1_catalog.compute())
+
+
+def test_save_catalog_compression_level_without_codec_support(small_sky_order1_catalog, tmp_path):
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1")
+    with pytest.raises(ValueError, match="does not take a compression level"):
+        small_sky_order1_catalog.to_hipscat(base_catalog_path, compression="snappy", compression_level=3)
+    assert not os.path.exists(base_catalog_path)
+
+
+def test_save_catalog_with_dtype_overrides(small_sky_order1_catalog, tmp_path):
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1")
+    dtype_overrides = {"ra": "float32", "dec": "float32"}
+    small_sky_order1_catalog.to_hipscat(base_catalog_path, dtype_overrides=dtype_overrides)
+    expected_catalog = lsdb.read_hipscat(base_catalog_path)
+    assert expected_catalog.dtypes["ra"] == "float32"
+    assert expected_catalog.dtypes["dec"] == "float32"
+    expected_df = small_sky_order1_catalog.compute().astype(dtype_overrides)
+    pd.testing.assert_frame_equal(expected_catalog.compute(), expected_df)
+
+
+def test_save_catalog_with_empty_partition(small_sky_order1_catalog, tmp_path):
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1")
+    filtered_catalog = small_sky_order1_catalog.query("ra > 320")
+    empty_partition = filtered_catalog.get_partition(1, 46).compute()
+    assert len(empty_partition) == 0
+    filtered_catalog.to_hipscat(base_catalog_path)
+    partition_info = pd.read_csv(os.path.join(base_catalog_path, "partition_info.csv"))
+    metadata = pq.read_metadata(os.path.join(base_catalog_path, "_metadata"))
+    assert len(partition_info) == metadata.num_row_groups == 3
+    for index, row in partition_info.iterrows():
+        row_group = metadata.row_group(index)
+        pixel_file = f"Norder={row['Norder']}/Dir={row['Dir']}/Npix={row['Npix']}.parquet"
+        assert row_group.column(0).file_path.endswith(pixel_file)
+        assert row_group.num_rows == row["num_rows"]
+    assert not os.path.exists(os.path.join(base_catalog_path, "Norder=1/Dir=0/Npix=46.parquet"))
+    expected_catalog = lsdb.read_hipscat(base_catalog_path)
+    assert HealpixPixel(1, 46) not in expected_catalog.get_healpix_pixels()
+    pd.testing.assert_frame_equal(expected_catalog.compute(), filtered_catalog.compute())
+
+
+def test_save_empty_catalog(small_sky_order1_catalog, tmp_path):
+    base_catalog_path = os.path.join(tmp_path, "small_sky_order1")
+    empty_catalog = small_sky_order1_catalog.query("ra > 10000")
+    with pytest.raises(ValueError, match="all of its partitions have zero rows"):
+        empty_catalog.to_hipscat(base_catalog_path)
+    assert not os.path.exists(base_catalog_path)
+    # Nothing is left behind that would make a retry fail with FileExistsError
+    with pytest.raises(ValueError, match="all of its partitions have zero rows"):
+        empty_catalog.to_hipscat(base_catalog_path)
+
+
 def test_save_catalog_overwrite(small_sky_catalog, tmp_path):
     base_catalog_path = os.path.join(tmp_path, "small_sky")
     small_sky_catalog.to_hipscat(base_catalog_path)
@@ -0,0 +1,33 @@
+import fsspec
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from lsdb.io.to_hipscat import ROW_GROUP_SIZE, ROW_GROUPS_PER_FILE, _write_dataframe, write_partitions
+
+
+def test_write_partitions_to_remote_file_system(small_sky_order1_catalog):
+    file_system = fsspec.filesystem("memory")
+    try:
+        partition_sizes, _ = write_partitions(small_sky_order1_catalog, "memory://small_sky_order1")
+        for pixel in small_sky_order1_catalog.get_healpix_pixels():
+            expected_df = small_sky_order1_catalog.get_partition(pixel.order, pixel.pixel).compute()
+            pixel_path = f"memory://small_sky_order1/Norder={pixel.order}/Dir=0/Npix={pixel.pixel}.parquet"
+            pd.testing.assert_frame_equal(pd.read_parquet(pixel_path), expected_df)
+            assert partition_sizes[pixel] == len(expected_df)
+    finally:
+        file_system.rm("/small_sky_order1", recursive=True)
+
+
+def test_write_dataframe_row_groups_scale_with_partition_size(tmp_path):
+    small_df = pd.DataFrame({"ra": np.arange(ROW_GROUP_SIZE, dtype=float)})
+    small_path = tmp_path / "small.parquet"
+    _write_dataframe(small_df, small_path, [])
+    assert pq.read_metadata(small_path).num_row_groups == 1
+    large_df = pd.DataFrame({"ra": np.arange(ROW_GROUP_SIZE * ROW_GROUPS_PER_FILE * 2 + 1, dtype=float)})
+    large_path = tmp_path / "large.parquet"
+    _write_dataframe(large_df, large_path, [])
+    large_metadata = pq.read_metadata(large_path)
+    assert large_metadata.num_row_groups == ROW_GROUPS_PER_FILE
+    assert large_metadata.row_group(0).column(0).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(large_path), large_df)